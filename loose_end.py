@@ -1,30 +1,221 @@
+import atexit
+import configparser
 import os
 import subprocess
+import sys
+import threading
+from concurrent.futures import Future
 import typer
-import requests
-from github import Github
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import loose_end_cache
+
+if TYPE_CHECKING:
+    import httpx
+
+GITHUB_API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+REQUEST_TIMEOUT = 10
+KEYRING_SERVICE = "loose-end"
+KEYRING_USERNAME = "github"
+
+# GraphQL documents, built once at import rather than on every call
+
+# Repository ID and repository and organization projects are queried together to save round-trips
+_Q_PROJECTS = """
+query($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) {
+    id
+    projectsV2(first: 20) {
+      nodes {
+        id
+        title
+        number
+      }
+    }
+  }
+  organization(login: $owner) {
+    projectsV2(first: 20) {
+      nodes {
+        id
+        title
+        number
+      }
+    }
+  }
+}
+"""
+
+# Same as _Q_PROJECTS, narrowed by GitHub's project search when a name is given with -p.
+# The unfiltered repository count keeps the org fallback to repos without projects of their own.
+_Q_PROJECTS_BY_NAME = """
+query($owner: String!, $repo: String!, $name: String!) {
+  repository(owner: $owner, name: $repo) {
+    id
+    all: projectsV2(first: 1) {
+      totalCount
+    }
+    projectsV2(query: $name, first: 5) {
+      nodes {
+        id
+        title
+        number
+      }
+    }
+  }
+  organization(login: $owner) {
+    projectsV2(query: $name, first: 5) {
+      nodes {
+        id
+        title
+        number
+      }
+    }
+  }
+}
+"""
+
+_M_CREATE_ISSUE_IN_PROJECT = """
+mutation($repositoryId: ID!, $projectId: ID!, $title: String!, $body: String) {
+  createIssue(input: {
+    repositoryId: $repositoryId
+    title: $title
+    body: $body
+    projectV2Ids: [$projectId]
+  }) {
+    issue {
+      id
+      url
+    }
+  }
+}
+"""
+
+_M_ADD_PROJECT_ITEM = """
+mutation($projectId: ID!, $contentId: ID!) {
+  addProjectV2ItemById(input: {
+    projectId: $projectId
+    contentId: $contentId
+  }) {
+    item {
+      id
+    }
+  }
+}
+"""
+
+# Shared HTTP/2 client so every GitHub call in one invocation, including concurrent
+# ones, is multiplexed over the same TCP+TLS connection.
+# Created on first use to keep the httpx import off the startup path.
+_CLIENT: Optional["httpx.Client"] = None
+_CLIENT_LOCK = threading.Lock()
 
 app = typer.Typer(
     help="🚀 Loose-End CLI Tool - Create GitHub issues with intelligent project linking",
     epilog="Examples:\n  loose-end\n  loose-end 'Bug fix' 'Fixed login issue' -p\n  loose-end 'Feature' 'Add dark mode' -p 'My Project'\n  loose-end --debug"
 )
 
+# Debug messages are buffered and written in batches to save stderr writes
+DEBUG_FLUSH_THRESHOLD = 32
+_debug_buf: List[str] = []
+_DEBUG_LOCK = threading.Lock()
+
+# Fixed pieces of the confirmation summary, styled once
+_HR = typer.style("="*50, fg=typer.colors.CYAN)
+_SUMMARY_HEADER = typer.style("📋 SUMMARY", fg=typer.colors.CYAN, bold=True)
+_LBL_TITLE = typer.style("Title:", fg=typer.colors.BLUE, bold=True)
+_LBL_DESCRIPTION = typer.style("Description:", fg=typer.colors.BLUE, bold=True)
+_LBL_REPOSITORY = typer.style("Repository:", fg=typer.colors.BLUE, bold=True)
+_LBL_PROJECT = typer.style("Project:", fg=typer.colors.BLUE, bold=True)
+_NO_PROJECT = typer.style("None", fg=typer.colors.YELLOW)
+
 def debug_print(message: str, debug_enabled: bool = False):
-    """Print debug message only if debug is enabled"""
+    """Queue debug message for stderr only if debug is enabled"""
     if debug_enabled:
-        typer.echo(f"🔍 {message}", err=True)
+        with _DEBUG_LOCK:
+            _debug_buf.append(f"🔍 {message}")
+            should_flush = len(_debug_buf) >= DEBUG_FLUSH_THRESHOLD
+        if should_flush:
+            flush_debug()
+
+def flush_debug():
+    """Write all queued debug messages to stderr in a single write"""
+    with _DEBUG_LOCK:
+        if not _debug_buf:
+            return
+        output = "\n".join(_debug_buf)
+        _debug_buf.clear()
+    typer.echo(output, err=True)
+
+atexit.register(flush_debug)
+
+def get_client(token: str) -> "httpx.Client":
+    """Return the shared HTTP client authenticated with the given token"""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            import httpx
 
-def check_if_git_repo() -> bool:
-    """Check if the current directory is a Git repository"""
+            _CLIENT = httpx.Client(
+                http2=True,
+                headers={"Accept": "application/vnd.github+json"},
+                timeout=REQUEST_TIMEOUT
+            )
+    authorization = f"Bearer {token}"
+    if _CLIENT.headers.get("Authorization") != authorization:
+        _CLIENT.headers["Authorization"] = authorization
+    return _CLIENT
+
+def find_git_dir(start: Optional[str] = None) -> Optional[str]:
+    """Find the Git directory holding the config for start (default: cwd), or None outside a repository"""
+    path = os.path.abspath(start or os.getcwd())
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git
+        if os.path.isfile(dot_git):
+            # Worktrees and submodules use a ".git" file of the form "gitdir: <path>"
+            with open(dot_git, encoding="utf-8") as f:
+                content = f.read().strip()
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = os.path.join(path, content[len("gitdir:"):].strip())
+            # Linked worktrees keep their config in the main repository's directory
+            commondir_file = os.path.join(git_dir, "commondir")
+            if os.path.isfile(commondir_file):
+                with open(commondir_file, encoding="utf-8") as f:
+                    git_dir = os.path.join(git_dir, f.read().strip())
+            return os.path.normpath(git_dir)
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+def read_remote_url(git_dir: str) -> Optional[str]:
+    """Read remote.origin.url from the repository config, or None if it can't be read in-process"""
+    config = configparser.ConfigParser(strict=False, interpolation=None)
     try:
-        subprocess.run(["git", "rev-parse", "--is-inside-work-tree"], check=True, capture_output=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+        config.read(os.path.join(git_dir, "config"), encoding="utf-8")
+    except (configparser.Error, UnicodeDecodeError):
+        return None
+    # Included files can override the remote, so leave those to git itself
+    if any(section == "include" or section.startswith("includeIf") for section in config.sections()):
+        return None
+    url = config.get('remote "origin"', "url", fallback="").strip().strip('"')
+    return url or None
 
 def get_remote_url() -> str:
-    """Fetch the remote URL (GitHub) for the current repository"""
+    """Fetch the remote URL (GitHub) for the current repository, or "" outside a Git repository"""
+    # Parse the config directly to avoid spawning git in the common case
+    if "GIT_DIR" not in os.environ:
+        try:
+            git_dir = find_git_dir()
+            url = read_remote_url(git_dir) if git_dir else None
+        except OSError:
+            url = None
+        if url:
+            return url
+
     try:
         result = subprocess.run(
             ["git", "config", "--get", "remote.origin.url"],
@@ -33,100 +224,155 @@ def get_remote_url() -> str:
             check=True
         )
         return result.stdout.strip()
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         return ""
 
-def get_projects_for_repo(token: str, owner: str, repo: str, debug: bool = False) -> list:
-    """Fetch projects for the repository using GitHub GraphQL API"""
+def get_repository_info(token: str, owner: str, repo: str, debug: bool = False, project_name: Optional[str] = None) -> dict:
+    """Return the repository node ID and its projects, served from the on-disk cache when fresh.
+
+    With project_name, the cache is used only if it contains that project; otherwise only
+    projects matching the name are fetched, falling back to the full list.
+    """
+    def has_project(info: dict) -> bool:
+        return any(p["name"].lower() == project_name.lower() for p in info["projects"])
+
+    cache_key = f"repository:{owner}/{repo}"
+    cached = loose_end_cache.get(cache_key)
+    if cached is not None:
+        # A project created since the list was cached must not be reported as missing
+        if not project_name or has_project(cached):
+            debug_print(f"Using cached repository info for {owner}/{repo}", debug)
+            return cached
+        debug_print(f"Project '{project_name}' not in cached repository info, fetching", debug)
+
+    if project_name:
+        info = fetch_repository_info(token, owner, repo, debug, project_name)
+        # Search results are partial, so they are used only on an exact match and never cached
+        if info is not None and has_project(info):
+            return info
+        debug_print(f"No exact match for project '{project_name}', fetching all projects", debug)
+
+    info = fetch_repository_info(token, owner, repo, debug)
+    if info is None:
+        return {"repository_id": None, "projects": []}
+    # Empty results are not cached since they may come from a transient API failure
+    if info["projects"]:
+        loose_end_cache.put(cache_key, info)
+    return info
+
+def fetch_repository_info(token: str, owner: str, repo: str, debug: bool = False, project_name: Optional[str] = None) -> Optional[dict]:
+    """Fetch the repository node ID and its projects, falling back to organization projects, in one GraphQL request"""
     try:
-        # GraphQL query to get projects linked to the repository
-        query = """
-        query($owner: String!, $repo: String!) {
-          repository(owner: $owner, name: $repo) {
-            projectsV2(first: 20) {
-              nodes {
-                id
-                title
-                number
-              }
-            }
-          }
-        }
-        """
-        
-        debug_print("GraphQL query for repository projects", debug)
-        
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
+        variables = {"owner": owner, "repo": repo}
+        if project_name:
+            debug_print(f"GraphQL query for repository and organization projects named '{project_name}'", debug)
+            query = _Q_PROJECTS_BY_NAME
+            variables["name"] = project_name
+        else:
+            debug_print("GraphQL query for repository and organization projects", debug)
+            query = _Q_PROJECTS
         
-        response = requests.post(
-            "https://api.github.com/graphql",
-            json={"query": query, "variables": {"owner": owner, "repo": repo}},
-            headers=headers
+        response = get_client(token).post(
+            GRAPHQL_URL,
+            json={"query": query, "variables": variables}
         )
         
-        if response.status_code == 200:
-            data = response.json()
-            if "data" in data and data["data"]["repository"]:
-                projects = data["data"]["repository"]["projectsV2"]["nodes"]
+        if response.status_code == 401:
+            # A rejected token must reach the caller instead of looking like "no projects"
+            raise api_error(response)
+        elif response.status_code == 200:
+            # Partial data is expected: "organization" is null (with an error) for user-owned repos
+            data = response.json().get("data") or {}
+            project_list = []
+            for scope in ("repository", "organization"):
+                if not data.get(scope):
+                    debug_print(f"No {scope} data found or access denied", debug)
+                    continue
+                projects = data[scope]["projectsV2"]["nodes"]
                 project_list = [{"id": p["id"], "name": p["title"], "number": p["number"]} for p in projects]
-                debug_print(f"Repository projects response: {len(project_list)} projects found", debug)
-                
-                # If no repository projects, try organization projects
-                if len(project_list) == 0:
-                    return get_org_projects(token, owner)
-                
-                return project_list
-            else:
-                debug_print("No repository data found or access denied", debug)
-                return get_org_projects(token, owner)
+                debug_print(f"{scope.capitalize()} projects response: {len(project_list)} projects found", debug)
+                if project_list:
+                    break
+                # A name search can miss in a repo that has projects; org projects are still not offered then
+                if data[scope].get("all", {}).get("totalCount"):
+                    debug_print(f"{scope.capitalize()} has projects, not falling back to organization projects", debug)
+                    break
+            # Without repository data, organization projects can still be listed; issues are then
+            # created through the REST API, which doesn't need the repository ID
+            repository_id = data["repository"]["id"] if data.get("repository") else None
+            return {"repository_id": repository_id, "projects": project_list}
         else:
             debug_print(f"GraphQL request failed: {response.status_code}", debug)
-            return []
+            return None
+    except BadCredentialsError:
+        raise
     except Exception as e:
         debug_print(f"Error fetching projects: {str(e)}", debug)
-        return []
+        return None
+
+class BadCredentialsError(RuntimeError):
+    """GitHub rejected the token (HTTP 401)"""
+
+def api_error(response: "httpx.Response") -> RuntimeError:
+    """Build an error of the form "<status> <message>" from a failed GitHub response"""
+    try:
+        message = response.json().get("message", response.text)
+    except ValueError:
+        message = response.text
+    error_class = BadCredentialsError if response.status_code == 401 else RuntimeError
+    return error_class(f"{response.status_code} {message}")
+
+def create_issue_in_project(token: str, repository_id: str, project_id: str, title: str, body: str, debug: bool = False) -> Optional[dict]:
+    """Create an issue already linked to a project with a single GraphQL mutation.
+
+    Returns None only if GitHub answered with errors and no createIssue result, i.e. it
+    rejected the mutation and created no issue. Any other failure raises, since the issue
+    may have been created anyway.
+    """
+    debug_print("Creating issue in project via GraphQL", debug)
+    debug_print(f"Repository ID: {repository_id}", debug)
+    debug_print(f"Project ID: {project_id}", debug)
+    
+    response = get_client(token).post(
+        GRAPHQL_URL,
+        json={
+            "query": _M_CREATE_ISSUE_IN_PROJECT,
+            "variables": {"repositoryId": repository_id, "projectId": project_id, "title": title, "body": body},
+        }
+    )
+    
+    if response.status_code == 200:
+        data = response.json()
+        created = (data.get("data") or {}).get("createIssue")
+        if created:
+            typer.echo(typer.style("✅ Issue successfully added to project!", fg=typer.colors.GREEN))
+            issue = created["issue"]
+            return {"node_id": issue["id"], "html_url": issue["url"]}
+        if data.get("errors"):
+            debug_print(f"GraphQL errors: {data['errors']}", debug)
+            return None
+    raise api_error(response)
 
 def add_issue_to_project(token: str, project_id: str, issue_node_id: str, debug: bool = False) -> bool:
     """Add an issue to a project using GitHub GraphQL API"""
     try:
-        mutation = """
-        mutation($projectId: ID!, $contentId: ID!) {
-          addProjectV2ItemById(input: {
-            projectId: $projectId
-            contentId: $contentId
-          }) {
-            item {
-              id
-            }
-          }
-        }
-        """
-        
         debug_print("Adding issue to project via GraphQL", debug)
         debug_print(f"Project ID: {project_id}", debug)
         debug_print(f"Issue Node ID: {issue_node_id}", debug)
         
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-        
-        response = requests.post(
-            "https://api.github.com/graphql",
-            json={"query": mutation, "variables": {"projectId": project_id, "contentId": issue_node_id}},
-            headers=headers
+        response = get_client(token).post(
+            GRAPHQL_URL,
+            json={"query": _M_ADD_PROJECT_ITEM, "variables": {"projectId": project_id, "contentId": issue_node_id}}
         )
         
         if response.status_code == 200:
             data = response.json()
-            if "data" in data and data["data"]["addProjectV2ItemById"]:
+            # GraphQL reports failures with a 200 status, "errors" and a null "data"
+            if (data.get("data") or {}).get("addProjectV2ItemById"):
                 typer.echo(typer.style("✅ Issue successfully added to project!", fg=typer.colors.GREEN))
                 return True
             else:
-                debug_print(f"GraphQL response: {data}", debug)
+                debug_print(f"GraphQL errors: {data.get('errors')}", debug)
                 return False
         else:
             debug_print(f"GraphQL mutation failed: {response.status_code}", debug)
@@ -135,86 +381,114 @@ def add_issue_to_project(token: str, project_id: str, issue_node_id: str, debug:
         debug_print(f"Error adding issue to project: {str(e)}", debug)
         return False
 
-def get_org_projects(token: str, owner: str, debug: bool = False) -> list:
-    """Fetch organization projects using GitHub GraphQL API"""
-    try:
-        query = """
-        query($owner: String!) {
-          organization(login: $owner) {
-            projectsV2(first: 20) {
-              nodes {
-                id
-                title
-                number
-              }
-            }
-          }
-        }
-        """
-        
-        debug_print("GraphQL query for organization projects", debug)
-        
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-        
-        response = requests.post(
-            "https://api.github.com/graphql",
-            json={"query": query, "variables": {"owner": owner}},
-            headers=headers
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            if "data" in data and data["data"]["organization"]:
-                projects = data["data"]["organization"]["projectsV2"]["nodes"]
-                project_list = [{"id": p["id"], "name": p["title"], "number": p["number"]} for p in projects]
-                debug_print(f"Organization projects response: {len(project_list)} projects found", debug)
-                return project_list
-            else:
-                debug_print("No organization data found or access denied", debug)
-                return []
-        else:
-            debug_print(f"GraphQL request failed: {response.status_code}", debug)
-            return []
-    except Exception as e:
-        debug_print(f"Error fetching org projects: {str(e)}", debug)
-        return []
+def create_issue(token: str, owner: str, repo: str, title: str, body: str, debug: bool = False) -> dict:
+    """Create an issue using GitHub REST API and return the created issue"""
+    debug_print(f"Creating issue with title: '{title}'", debug)
+    debug_print(f"API call: POST /repos/{owner}/{repo}/issues", debug)
+    debug_print(f"Payload: {{\"title\": \"{title}\", \"body\": \"{body}\"}}", debug)
+
+    response = get_client(token).post(
+        f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues",
+        json={"title": title, "body": body}
+    )
+
+    if response.status_code != 201:
+        raise api_error(response)
+    return response.json()
 
 def get_github_token() -> str:
-    """Get GitHub token from environment or ask user for input"""
+    """Get GitHub token from environment or OS keyring, or ask user for input"""
     token = os.getenv("GITHUB_TOKEN")
     if token:
         return token
+
+    # Imported here since keyring backends are only needed when no token is in the environment
+    import keyring
+    from keyring.errors import KeyringError
+
+    try:
+        token = keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+    except KeyringError:
+        token = None
+    if token:
+        return token
     
-    # If the token is not set, prompt the user to input it
+    # If the token is not stored yet, prompt the user to input it
     token = typer.prompt("Please enter your GitHub Personal Access Token", type=str, hide_input=True)
-    os.environ["GITHUB_TOKEN"] = token  # Set it as an environment variable for future use
+    try:
+        keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, token)  # Store it so future runs skip the prompt
+    except KeyringError:
+        typer.echo(typer.style("⚠️  Could not save the token to the OS keyring; set GITHUB_TOKEN to avoid this prompt", fg=typer.colors.YELLOW), err=True)
     return token
 
+def handle_bad_credentials():
+    """Explain a token GitHub rejected, and drop it from the keyring if it was saved there"""
+    # A token from GITHUB_TOKEN is the user's to fix; anything else came from the keyring
+    if os.getenv("GITHUB_TOKEN"):
+        typer.echo(typer.style("💡 Check the token in your GITHUB_TOKEN environment variable", fg=typer.colors.YELLOW), err=True)
+    elif forget_github_token():
+        typer.echo(typer.style("💡 Removed the saved GitHub token; you'll be asked for a new one next time", fg=typer.colors.YELLOW), err=True)
+    else:
+        typer.echo(typer.style("💡 Remove the saved token with: keyring del loose-end github", fg=typer.colors.YELLOW), err=True)
+
+def run_in_background(fn, *args) -> Future:
+    """Run fn(*args) in a daemon thread and return a future for its result.
+
+    Unlike a ThreadPoolExecutor worker, the thread isn't joined at exit, so aborting
+    a prompt with Ctrl-C doesn't wait for a stalled request to time out.
+    """
+    future: Future = Future()
+
+    def worker():
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
+def prompt_issue_details(title: Optional[str], description: Optional[str]) -> Tuple[str, str]:
+    """Ask for the title and description unless they were given on the command line"""
+    if title is None:
+        title = typer.prompt(typer.style("📝 Issue Title", fg=typer.colors.BLUE))
+    if description is None:
+        description = typer.prompt(typer.style("📄 Issue Description", fg=typer.colors.BLUE))
+    return title, description
+
+def forget_github_token() -> bool:
+    """Delete the token saved in the OS keyring, returning whether that succeeded"""
+    import keyring
+    from keyring.errors import KeyringError
+
+    try:
+        keyring.delete_password(KEYRING_SERVICE, KEYRING_USERNAME)
+        return True
+    except KeyringError:
+        return False
+
 @app.command()
 def loose_end(
     title: Optional[str] = typer.Argument(None, help="Issue title"),
     description: Optional[str] = typer.Argument(None, help="Issue description"),
     project: Optional[str] = typer.Option(None, "-p", "--project", help="Project name to link to, or use first project if -p without value"),
-    debug: bool = typer.Option(False, "--debug", help="Enable debug output")
+    debug: bool = typer.Option(False, "--debug", help="Enable debug output"),
+    yes: bool = typer.Option(False, "-y", "--yes", help="Create the issue without asking for confirmation")
 ):
     """
     Create a GitHub issue and optionally link it to a project.
     
     Run without arguments for interactive mode, or provide title and description for fast mode.
     Use -p to auto-link to first project, or -p "Project Name" for specific project.
+    The confirmation is skipped with -y, when title, description and -p are all given, or when stdin is not a terminal.
     """
-    # Step 1: Check if we're inside a git repo
-    if not check_if_git_repo():
-        typer.echo(typer.style("❌ This is not a Git repository.", fg=typer.colors.RED), err=True)
-        raise typer.Exit(1)
-    
-    # Step 2: Get the remote URL and parse owner/repo from it
+    # Decide before prompting, since prompts fill in title and description
+    skip_confirm = yes or (title is not None and description is not None and project is not None) or not sys.stdin.isatty()
+
+    # Step 1-2: Get the remote URL, which also fails when we're not inside a git repo
     remote_url = get_remote_url()
     if not remote_url:
-        typer.echo(typer.style("❌ No remote URL found. Make sure the repo has a remote set.", fg=typer.colors.RED), err=True)
+        typer.echo(typer.style("❌ Not a Git repository or no remote URL found. Make sure the repo has a remote set.", fg=typer.colors.RED), err=True)
         raise typer.Exit(1)
 
     # Step 3: Extract owner and repo from the remote URL
@@ -237,17 +511,35 @@ def loose_end(
 
     # Step 4: Get GitHub token and authenticate
     token = get_github_token()
-    gh = Github(token)
-    
-    # Step 5: List available projects for the repo
-    projects = get_projects_for_repo(token, owner, repo, debug)
-    project_names = [project["name"] for project in projects]
+
+    # Start fetching projects in the background so the request overlaps with the user typing
+    repository_future = run_in_background(get_repository_info, token, owner, repo, debug, project)
+
+    # Handle title and description while projects load, unless a project name was given with -p:
+    # that name is checked first so a typo doesn't throw away what the user typed
+    if not project:
+        title, description = prompt_issue_details(title, description)
+
+    # Step 5: List available projects for the repo, waiting only now for the background fetch
+    try:
+        repository_info = repository_future.result()
+    except BadCredentialsError as e:
+        typer.echo(typer.style(f"❌ Failed to fetch projects: {e}", fg=typer.colors.RED), err=True)
+        handle_bad_credentials()
+        raise typer.Exit(1)
+    projects = repository_info["projects"]
+    # Index projects by name once; setdefault so the first project wins on duplicate names
+    projects_by_name = {}
+    projects_by_name_ci = {}
+    for p in projects:
+        projects_by_name.setdefault(p["name"], p)
+        projects_by_name_ci.setdefault(p["name"].lower(), p)
     
     # Debug logging for projects
     debug_print(f"Found {len(projects)} projects for {owner}/{repo}", debug)
     for i, proj in enumerate(projects):
         debug_print(f"Project {i+1}: {proj}", debug)
-    debug_print(f"Project names: {project_names}", debug)
+    debug_print(f"Project names: {[p['name'] for p in projects]}", debug)
 
     # Step 6: Handle project selection based on available projects and CLI args
     selected_project = None
@@ -261,9 +553,9 @@ def loose_end(
             else:
                 typer.echo(typer.style("❌ No projects found to auto-select", fg=typer.colors.RED), err=True)
         else:  # -p with specific project name
-            matching_projects = [p for p in projects if p["name"].lower() == project.lower()]
-            if matching_projects:
-                selected_project = matching_projects[0]["name"]
+            matching_project = projects_by_name_ci.get(project.lower())
+            if matching_project:
+                selected_project = matching_project["name"]
                 typer.echo(typer.style(f"📋 Selected project: {selected_project}", fg=typer.colors.GREEN))
             else:
                 typer.echo(typer.style(f"❌ Project '{project}' not found", fg=typer.colors.RED), err=True)
@@ -299,53 +591,48 @@ def loose_end(
     else:
         typer.echo(typer.style("📋 No projects found for this repository", fg=typer.colors.YELLOW))
 
-    # Handle title and description (fast mode vs interactive)
-    if title is None:
-        title = typer.prompt(typer.style("📝 Issue Title", fg=typer.colors.BLUE))
-    if description is None:
-        description = typer.prompt(typer.style("📄 Issue Description", fg=typer.colors.BLUE))
+    title, description = prompt_issue_details(title, description)
 
     # Step 7: Show confirmation overview
-    typer.echo("\n" + typer.style("="*50, fg=typer.colors.CYAN))
-    typer.echo(typer.style("📋 SUMMARY", fg=typer.colors.CYAN, bold=True))
-    typer.echo(typer.style("="*50, fg=typer.colors.CYAN))
-    typer.echo(f"{typer.style('Title:', fg=typer.colors.BLUE, bold=True)} {title}")
-    typer.echo(f"{typer.style('Description:', fg=typer.colors.BLUE, bold=True)} {description}")
-    typer.echo(f"{typer.style('Repository:', fg=typer.colors.BLUE, bold=True)} {typer.style(f'{owner}/{repo}', fg=typer.colors.GREEN)}")
-    typer.echo(f"{typer.style('Project:', fg=typer.colors.BLUE, bold=True)} {typer.style(selected_project if selected_project else 'None', fg=typer.colors.GREEN if selected_project else typer.colors.YELLOW)}")
-    typer.echo(typer.style("="*50, fg=typer.colors.CYAN))
+    typer.echo("\n" + _HR)
+    typer.echo(_SUMMARY_HEADER)
+    typer.echo(_HR)
+    typer.echo(f"{_LBL_TITLE} {title}")
+    typer.echo(f"{_LBL_DESCRIPTION} {description}")
+    typer.echo(f"{_LBL_REPOSITORY} {typer.style(f'{owner}/{repo}', fg=typer.colors.GREEN)}")
+    typer.echo(f"{_LBL_PROJECT} {typer.style(selected_project, fg=typer.colors.GREEN) if selected_project else _NO_PROJECT}")
+    typer.echo(_HR)
     
-    if not typer.confirm(typer.style("✨ Create this issue?", fg=typer.colors.GREEN, bold=True), default=True):
+    if not skip_confirm and not typer.confirm(typer.style("✨ Create this issue?", fg=typer.colors.GREEN, bold=True), default=True):
         typer.echo(typer.style("❌ Issue creation cancelled", fg=typer.colors.RED))
         raise typer.Exit(0)
 
     # Step 8: Create the issue on GitHub
     try:
-        debug_print(f"Attempting to access repository: {owner}/{repo}", debug)
-        repository = gh.get_repo(f"{owner}/{repo}")
-        debug_print("Repository found successfully", debug)
-        debug_print(f"Creating issue with title: '{title}'", debug)
-        debug_print(f"API call: POST /repos/{owner}/{repo}/issues", debug)
-        
-        debug_print(f"Payload: {{\"title\": \"{title}\", \"body\": \"{description}\"}}", debug)
-        issue = repository.create_issue(
-            title=title,
-            body=description
-        )
+        project_data = projects_by_name.get(selected_project) if selected_project else None
 
-        # Step 8: If linked to project, add the issue to the project board
-        if selected_project and projects:
-            project_data = next((p for p in projects if p["name"] == selected_project), None)
+        # Create and link the issue in one request when possible; fall back to two steps only
+        # when the repository ID is unknown or GitHub rejected the mutation without creating anything
+        issue = None
+        if project_data:
+            repository_id = repository_info["repository_id"]
+            if repository_id:
+                issue = create_issue_in_project(token, repository_id, project_data["id"], title, description, debug)
+
+        if issue is None:
+            issue = create_issue(token, owner, repo, title, description, debug)
+
+            # Step 8: If linked to project, add the issue to the project board
             if project_data:
                 try:
-                    success = add_issue_to_project(token, project_data["id"], issue.node_id, debug)
+                    success = add_issue_to_project(token, project_data["id"], issue["node_id"], debug)
                     if not success:
                         typer.echo(typer.style("⚠️  Issue created but failed to add to project", fg=typer.colors.YELLOW), err=True)
                 except Exception as e:
                     typer.echo(typer.style(f"⚠️  Issue created but failed to add to project: {str(e)}", fg=typer.colors.YELLOW), err=True)
         
         # Step 9: Success message
-        typer.echo(typer.style(f"✅ Issue created successfully! {issue.html_url}", fg=typer.colors.GREEN, bold=True))
+        typer.echo(typer.style(f"✅ Issue created successfully! {issue['html_url']}", fg=typer.colors.GREEN, bold=True))
 
     except Exception as e:
         error_msg = str(e)
@@ -355,6 +642,9 @@ def loose_end(
             typer.echo(typer.style("   • Classic token: needs 'repo' scope", fg=typer.colors.YELLOW), err=True)
             typer.echo(typer.style("   • Fine-grained token: needs 'Issues' write permission", fg=typer.colors.YELLOW), err=True)
             typer.echo(typer.style("💡 Update at: https://github.com/settings/tokens", fg=typer.colors.BLUE), err=True)
+        elif isinstance(e, BadCredentialsError):
+            typer.echo(typer.style(f"❌ Failed to create issue: {error_msg}", fg=typer.colors.RED), err=True)
+            handle_bad_credentials()
         else:
             typer.echo(typer.style(f"❌ Failed to create issue: {error_msg}", fg=typer.colors.RED), err=True)
         raise typer.Exit(1)
@@ -0,0 +1,44 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+from typing import Any, Optional
+
+DEFAULT_TTL = 900
+
+def get_cache_dir() -> str:
+    """Return the directory used for the on-disk cache"""
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "loose-end")
+
+def _cache_path(key: str) -> str:
+    """Map a cache key to its file path"""
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(get_cache_dir(), f"{digest}.json.gz")
+
+def get(key: str) -> Optional[Any]:
+    """Return cached data for key, or None if it is missing, expired or unreadable"""
+    try:
+        with gzip.open(_cache_path(key), "rt", encoding="utf-8") as f:
+            entry = json.load(f)
+        if time.time() - entry["ts"] > entry["ttl"]:
+            return None
+        return entry["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def put(key: str, data: Any, ttl: int = DEFAULT_TTL) -> None:
+    """Store data for key; failures to write the cache are ignored"""
+    path = _cache_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"ts": time.time(), "ttl": ttl, "data": data}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass